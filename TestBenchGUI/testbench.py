@@ -1,4 +1,5 @@
 import sys
+import os
 import json
 import numpy as np
 import struct
@@ -6,20 +7,132 @@ import pyqtgraph as pg
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QComboBox, QFileDialog, QScrollArea, QInputDialog, 
-    QMessageBox, QMenuBar, QAction, QMenu, 
+    QMessageBox, QMenuBar, QAction, QMenu, QPlainTextEdit,
 )
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, QThread, QObject, Qt, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QKeySequence, QIcon
-from scipy.interpolate import interp1d, BarycentricInterpolator
+from scipy.interpolate import interp1d
 import serial
 import serial.tools.list_ports
 import copy
+from bisect import insort
+from collections import deque
 import thruster_selection
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# eight stacked plots repaint together: skip antialiasing and draw through an OpenGL viewport
+pg.setConfigOptions(antialias=False, useOpenGL=True, useNumba=NUMBA_AVAILABLE)
 
 PWM_MIN, PWM_MAX = 1100, 1900
 THRUSTER_COUNT = 8
 DEFAULT_FREQUENCY = 20  # Hz
 DEFAULT_BAUD = 115200
+PACKET_HEADER = bytes.fromhex('AA0000')
+PACKET_TRAILER = bytes.fromhex('EE')
+
+def _build_crc8_table():
+    """CRC-8 (poly 0x07) of every single byte value, computed bit by bit."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = (crc << 1) ^ 0x07
+            else:
+                crc <<= 1
+            crc &= 0xFF
+        table.append(crc)
+    return table
+
+CRC8_TABLE = bytes(_build_crc8_table())
+
+def crc8_update(crc: int, data) -> int:
+    """Feed data into a running CRC-8, one table lookup per byte."""
+    table = CRC8_TABLE
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+# CRC of the constant packet header, so only the payload is hashed per packet
+CRC_SEED = crc8_update(0x00, PACKET_HEADER)
+
+def serial_fileno(serial_conn):
+    """Raw file descriptor of an open port, None if the backend has none (Windows, URL handlers)."""
+    try:
+        return serial_conn.fileno()
+    except (AttributeError, OSError):
+        return None
+
+def write_frame(serial_conn, fd, frame):
+    """Write a frame with os.write on the raw descriptor, skipping pyserial's write() when possible."""
+    if fd is None:
+        serial_conn.write(frame)
+        return
+    try:
+        written = os.write(fd, frame)
+    except BlockingIOError:
+        written = 0
+    # pyserial opens the port non-blocking, let it wait for room if the output buffer is full
+    if written < len(frame):
+        serial_conn.write(frame[written:])
+
+def send_frame(frame, serial_conn, fd, payload=None, tx_log=None):
+    """Fill in the payload and CRC of a frame buffer and write it, payload None if it is already packed."""
+    tx = memoryview(frame)
+    if payload is not None: tx[3:19] = payload
+    tx[19] = crc8_update(CRC_SEED, tx[3:19])
+    write_frame(serial_conn, fd, frame)
+    if tx_log is not None: tx_log.append(bytes(frame))
+
+def barycentric_weights(times):
+    """Barycentric weights w_l = 1 / prod_(r != l) (t_l - t_r), they only depend on the times."""
+    # the formula only needs the weights up to a common factor: scale the differences like scipy
+    # does, otherwise the product over hundreds of points overflows and every weight becomes 0
+    scale = 4.0 / (times.max() - times.min()) if len(times) > 1 else 1.0
+    diff = (times[:, None] - times[None, :]) * scale + np.eye(len(times))
+    return 1.0 / np.prod(diff, axis=1)
+
+def barycentric_eval(times, pwm_values, weights, t_interp):
+    """Evaluate the interpolating polynomial at t_interp with the second barycentric formula."""
+    diff = t_interp[:, None] - times[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = weights / diff
+        y = (terms @ pwm_values) / terms.sum(axis=1)
+    # the formula is 0/0 on the points themselves, take the point value there
+    rows, cols = np.nonzero(diff == 0)
+    y[rows] = pwm_values[cols]
+    return y
+
+if NUMBA_AVAILABLE:
+    # same result as the NumPy version above, without the (len(t_interp), len(times)) temporaries
+    @njit(cache=True)
+    def barycentric_eval(times, pwm_values, weights, t_interp):
+        y = np.empty(t_interp.size)
+        for k in range(t_interp.size):
+            x = t_interp[k]
+            num = 0.0
+            den = 0.0
+            exact = -1
+            for l in range(times.size):
+                d = x - times[l]
+                if d == 0.0:
+                    exact = l
+                    break
+                tmp = weights[l] / d
+                num += tmp * pwm_values[l]
+                den += tmp
+            if exact >= 0:
+                y[k] = pwm_values[exact]
+            elif den == 0.0:
+                # degenerate weights: NaN like the NumPy version, instead of raising ZeroDivisionError
+                y[k] = np.nan
+            else:
+                y[k] = num / den
+        return y
 
 def main():
     app = QApplication(sys.argv)
@@ -29,7 +142,62 @@ def main():
     window.show()
     sys.exit(app.exec())
 
+class SerialWorker(QObject):
+    """Streams the cached PWM columns from its own thread, so GUI work can't delay the packets."""
+    step_sent = pyqtSignal(int)
+    finished = pyqtSignal()
+
+    def __init__(self, tx_buf):
+        super().__init__()
+        self.serial_conn = None
+        self.tx_fd = None
+        self.pwms = np.empty((THRUSTER_COUNT, 0), dtype='<u2')
+        self.step = 0
+        self.timer = None
+        self.tx_log = None # set to a deque by the GUI while the TX log is shown
+        # shared with the GUI, which only writes to it while the worker is stopped
+        self.tx_buf = tx_buf
+
+    @pyqtSlot(object, object, int)
+    def start(self, serial_conn, pwms, period):
+        if self.timer is None:
+            # created here so that it lives in the worker thread
+            self.timer = QTimer(self)
+            self.timer.setTimerType(Qt.PreciseTimer)
+            self.timer.timeout.connect(self.tick)
+        self.serial_conn = serial_conn
+        self.tx_fd = serial_fileno(serial_conn)
+        self.pwms = pwms
+        self.step = 0 # at each step, we increment this, so I know what values I have to output
+        self.timer.start(period)
+
+    @pyqtSlot(int)
+    def set_period(self, period):
+        if self.timer is not None and self.timer.isActive():
+            self.timer.start(period)
+
+    @pyqtSlot()
+    def stop(self):
+        if self.timer is not None: self.timer.stop()
+        self.serial_conn = None
+        self.tx_fd = None
+
+    @pyqtSlot()
+    def tick(self):
+        if self.step < self.pwms.shape[1]:
+            # copy the cached column straight into the packet, it is already clamped and packed
+            send_frame(self.tx_buf, self.serial_conn, self.tx_fd, self.pwms[:, self.step].tobytes(), self.tx_log)
+            self.step += 1
+            self.step_sent.emit(self.step)
+        else:
+            self.timer.stop()
+            self.finished.emit()
+
 class ThrusterGUI(QMainWindow):
+    start_output = pyqtSignal(object, object, int)
+    stop_output = pyqtSignal()
+    period_changed = pyqtSignal(int)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ROV Thruster PWM Controller")
@@ -46,15 +214,46 @@ class ThrusterGUI(QMainWindow):
         self.serial_port = None
         self.output_frequency = DEFAULT_FREQUENCY
 
-        self.cached_pwms = [([], [])] * 8
-        self.serial_timer = QTimer(self)
-        self.serial_timer.timeout.connect(self.send_pwms)
+        self.cached_pwms = np.empty((THRUSTER_COUNT, 0), dtype='<u2')
         self.serial_conn = None
+        self._tx_fd = None
         self.serial_status = 0
+        # header + 8 x uint16 payload + crc + trailer, reused for every packet by the GUI and the worker
+        self._tx_buf = bytearray(PACKET_HEADER + bytes(2 * THRUSTER_COUNT + 1) + PACKET_TRAILER)
+        # sent packets, filled only while the TX log is shown and drained by a slow timer
+        self._debug = False
+        self._tx_log = deque(maxlen=1024)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(500)
+        self._log_timer.timeout.connect(self.drain_tx_log)
 
         self.points = [[] for _ in range(THRUSTER_COUNT)]
+        self._bary_cache = [None] * THRUSTER_COUNT
+        self._curve_cache = [{} for _ in range(THRUSTER_COUNT)]
+        self.max_time = 0
+        self._max_time_dirty = True
+        self._t_interp = None
+        self._t_interp_key = None
         self.setup_ui()
 
+        # the output loop runs in its own thread, it only holds the port between start and stop
+        self.serial_thread = QThread(self)
+        self.serial_worker = SerialWorker(self._tx_buf)
+        self.serial_worker.moveToThread(self.serial_thread)
+        self.start_output.connect(self.serial_worker.start)
+        # blocking, so the worker is done with the port before we write to it or close it
+        self.stop_output.connect(self.serial_worker.stop, Qt.BlockingQueuedConnection)
+        self.period_changed.connect(self.serial_worker.set_period)
+        self.serial_worker.step_sent.connect(self.update_status)
+        self.serial_worker.finished.connect(self.serial_send_idle)
+        self.serial_thread.start()
+
+    def closeEvent(self, event):
+        self.stop_output.emit()
+        self.serial_thread.quit()
+        self.serial_thread.wait()
+        super().closeEvent(event)
+
     def setup_ui(self):
         """Set up the UI with graphs and controls."""
         central_widget = QWidget()
@@ -76,6 +275,8 @@ class ThrusterGUI(QMainWindow):
 
         # Graphs
         self.graphs = []
+        self._curve_item = []
+        self._points_item = []
         for i in range(THRUSTER_COUNT):
             plot = pg.PlotWidget(title=f"Thruster {i+1}")
             plot.setBackground("w")
@@ -93,6 +294,11 @@ class ThrusterGUI(QMainWindow):
             plot.getViewBox().setLimits(xMin=0)
 
             plot.setMinimumHeight(350)
+
+            # persistent items, updated in place with setData
+            self._curve_item.append(plot.plot([], [], pen='b'))  # Blue line for interpolated curve
+            self._points_item.append(plot.plot([], [], pen=None, symbol='o', symbolBrush='r', pxMode=True))  # Red dots for points
+
             self.graphs.append(plot)
             graph_layout.addWidget(plot)
 
@@ -184,6 +390,14 @@ class ThrusterGUI(QMainWindow):
         control_layout.addWidget(self.status_label)
         
         main_layout.addWidget(scroll_area)
+
+        # TX log, hidden unless enabled from the Serial menu
+        self.tx_log_view = QPlainTextEdit()
+        self.tx_log_view.setReadOnly(True)
+        self.tx_log_view.setMaximumBlockCount(1024)
+        self.tx_log_view.setMaximumHeight(150)
+        self.tx_log_view.hide()
+        main_layout.addWidget(self.tx_log_view)
         main_layout.addLayout(control_layout)
 
         central_widget.setLayout(main_layout)
@@ -232,6 +446,29 @@ class ThrusterGUI(QMainWindow):
             freq_menu.addAction(freq_action)
 
         self.serial_menu.addMenu(freq_menu)
+
+        # ---- TX LOG ----
+        log_action = QAction("Show TX log", self, checkable=True)
+        log_action.setChecked(self._debug)
+        log_action.triggered.connect(self.set_debug)
+        self.serial_menu.addAction(log_action)
+
+    def set_debug(self, enabled: bool):
+        """Show or hide the log of sent packets."""
+        self._debug = enabled
+        self.serial_worker.tx_log = self._tx_log if enabled else None
+        self.tx_log_view.setVisible(enabled)
+        if enabled:
+            self._log_timer.start()
+        else:
+            self._log_timer.stop()
+            self._tx_log.clear()
+
+    def drain_tx_log(self):
+        lines = []
+        while self._tx_log:
+            lines.append(self._tx_log.popleft().hex(' '))
+        if lines: self.tx_log_view.appendPlainText("\n".join(lines))
     
     def copy_paste_graphs(self):
         graph_src, ok = QInputDialog.getInt(self, "Source Thruster", "Enter thruster number (1-8):", min=1, max=8)
@@ -242,8 +479,8 @@ class ThrusterGUI(QMainWindow):
         if not graphs_dest : return
         for i in graphs_dest:
             self.points[i] = copy.deepcopy(self.points[graph_src - 1])
+            self.points_changed(i)
             self.update_graph(i)
-            self.interpolate_thruster_curve(i)
         ''' ez version
         graph_dest, ok = QInputDialog.getInt(self, "Destination Thruster", "Enter thruster number (1-8):", min=1, max=8)
         if not ok: return
@@ -264,8 +501,8 @@ class ThrusterGUI(QMainWindow):
         for i in selected_graphs:
             for point in self.points[i]:
                 point[0] *= scale_factor
+            self.points_changed(i)
             self.update_graph(i)
-            self.interpolate_thruster_curve(i)
 
     def scale_graphs_pwm(self):
         selected_graphs_dialog = thruster_selection.CheckboxInputDialog("Scale PWM axis.", "Select the thruster(s):", self)
@@ -277,8 +514,8 @@ class ThrusterGUI(QMainWindow):
         for i in selected_graphs:
             for point in self.points[i]:
                 point[1] = 1500 + scale_factor * (point[1] - 1500)
+            self.points_changed(i)
             self.update_graph(i)
-            self.interpolate_thruster_curve(i)
 
     def add_point_dialog(self):
         thruster_num, ok = QInputDialog.getInt(self, "Add Point", "Enter thruster number (1-8):", min=1, max=8)
@@ -290,8 +527,8 @@ class ThrusterGUI(QMainWindow):
         pwm_value, ok = QInputDialog.getInt(self, "Add Point", "Enter PWM value (1100-1900):", min=1100, max=1900)
         if not ok : return
         
-        self.points[thruster_num - 1].append([time_value, pwm_value])
-        self.points[thruster_num - 1].sort()  # Keep sorted by time
+        insort(self.points[thruster_num - 1], [time_value, pwm_value])  # Keep sorted by time
+        self.points_changed(thruster_num - 1)
         self.update_graph(thruster_num - 1)
 
     def edit_point_dialog(self):
@@ -304,11 +541,10 @@ class ThrusterGUI(QMainWindow):
             QMessageBox.warning(self, "No Points", "No points to edit!")
             return
         
-        point_list = [f"t={t:.2f}s, PWM={p}" for t, p in self.points[thruster_index]]
-        selected_point, ok = QInputDialog.getItem(self, "Edit Point", "Select a point:", point_list, editable=False)
-        if not ok : return
+        point_dialog = thruster_selection.PointSelectionDialog("Edit Point", "Select a point:", self.points[thruster_index], self)
+        if not point_dialog.exec_() : return
         
-        selected_index = point_list.index(selected_point)
+        selected_index = point_dialog.get_selected()
         new_time, ok = QInputDialog.getDouble(self, "Edit Point", "Enter new time (s):", min=0, decimals=4)
         if not ok:
             return
@@ -317,8 +553,9 @@ class ThrusterGUI(QMainWindow):
         if not ok:
             return
         
-        self.points[thruster_index][selected_index] = [new_time, new_pwm]
-        self.points[thruster_index].sort()
+        del self.points[thruster_index][selected_index]
+        insort(self.points[thruster_index], [new_time, new_pwm])
+        self.points_changed(thruster_index)
         self.update_graph(thruster_index)
     
     def remove_point_dialog(self):
@@ -331,54 +568,84 @@ class ThrusterGUI(QMainWindow):
             QMessageBox.warning(self, "No Points", "No points to remove!")
             return
         
-        point_list = [f"t={t:.2f}s, PWM={p}" for t, p in self.points[thruster_index]]
-        selected_point, ok = QInputDialog.getItem(self, "Remove Point", "Select a point to remove:", point_list, editable=False)
-        if not ok:
+        point_dialog = thruster_selection.PointSelectionDialog("Remove Point", "Select a point to remove:", self.points[thruster_index], self)
+        if not point_dialog.exec_():
             return
         
-        selected_index = point_list.index(selected_point)
+        selected_index = point_dialog.get_selected()
         del self.points[thruster_index][selected_index]
+        self.points_changed(thruster_index)
         self.update_graph(thruster_index)
 
+    def points_changed(self, idx):
+        """Drop everything cached from the points of a thruster."""
+        self._bary_cache[idx] = None
+        self._curve_cache[idx].clear()
+        self._max_time_dirty = True
+
     def update_graph(self, idx):
         """Re-draw the graph with the latest data."""
         points = self.points[idx]
         if points:
-            x, y = zip(*sorted(points))
-            self.graphs[idx].clear()
-            self.graphs[idx].plot(x, y, pen='b', symbol='o', symbolBrush='r')
+            points = np.asarray(points, dtype=np.float64)
+            self._points_item[idx].setData(points[:, 0], points[:, 1])
         else :
-            self.graphs[idx].clear()
+            self._points_item[idx].setData([], [])
+        self.interpolate_thruster_curve(idx)
 
     def change_interpolation(self, method: str):
         """Change the interpolation method."""
         self.selected_interpolation = self.interpolation_methods[method]
         for i in range(THRUSTER_COUNT) : self.interpolate_thruster_curve(i)
 
-    def interpolate_thruster_curve(self, thruster_index):
-        points = self.points[thruster_index]
-
-        times, pwm_values = zip(*points)
-        times = np.array(times)
-        pwm_values = np.array(pwm_values)
+    def interpolate(self, thruster_index, t_interp):
+        """Evaluate the thruster's curve at t_interp with the selected method."""
+        points = np.asarray(self.points[thruster_index], dtype=np.float64)
+        times, pwm_values = points[:, 0], points[:, 1]
 
         if self.selected_interpolation == "linear":
-            f = interp1d(times, pwm_values, kind="linear", fill_value="extrapolate")
+            # np.interp holds the end values outside the points, which the PWM clip would do anyway
+            return np.interp(t_interp, times, pwm_values)
         elif self.selected_interpolation == "constant":
             f = interp1d(times, pwm_values, kind="previous", fill_value="extrapolate")
         elif self.selected_interpolation == "polynomial":
-            f = BarycentricInterpolator(times, pwm_values)
+            if self._bary_cache[thruster_index] is None:
+                self._bary_cache[thruster_index] = barycentric_weights(times)
+            return barycentric_eval(times, pwm_values, self._bary_cache[thruster_index], t_interp)
+        return f(t_interp)
 
+    def time_axis(self):
+        """Output times shared by all thrusters, rebuilt only when max_time or the frequency change."""
         self.compute_max_time()
+        key = (self.max_time, self.output_frequency)
+        if self._t_interp_key != key:
+            self._t_interp = np.linspace(0, round(self.max_time), int(self.max_time * self.output_frequency) + 1) # each step should be the same as the period
+            self._t_interp_key = key
+            # curves on the old axis are stale for every thruster
+            for cache in self._curve_cache: cache.clear()
+        return self._t_interp
+
+    def interpolated_curve(self, thruster_index):
+        """Clipped (t_interp, y_interp) of a thruster, reused until its points or the time axis change."""
+        t_interp = self.time_axis()
+        # time_axis() empties the caches when the axis changes, so they only hold one entry per method
+        key = self.selected_interpolation
+        cache = self._curve_cache[thruster_index]
+        if key not in cache:
+            y_interp = self.interpolate(thruster_index, t_interp)
+            # NaN survives np.clip and becomes 0 in the uint16 PWM array, never send that
+            bad = ~np.isfinite(y_interp)
+            if bad.any():
+                print(f"Thruster {thruster_index + 1}: {bad.sum()} samples could not be interpolated, set to 1500")
+                y_interp[bad] = 1500
+            cache[key] = (t_interp, np.clip(y_interp, 1100, 1900))
+        return cache[key]
 
-        t_interp = np.linspace(0, round(self.max_time), int(self.max_time * self.output_frequency) + 1)
-        y_interp = f(t_interp)
-
-        y_interp = np.clip(y_interp, 1100, 1900)
-
-        self.graphs[thruster_index].clear()
-        self.graphs[thruster_index].plot(t_interp, y_interp, pen='b')  # Blue line for interpolated curve
-        self.graphs[thruster_index].plot(times, pwm_values, pen=None, symbol='o', symbolBrush='r')  # Red dots for points
+    def interpolate_thruster_curve(self, thruster_index):
+        if len(self.points[thruster_index]) < 2:
+            self._curve_item[thruster_index].setData([], [])
+            return
+        self._curve_item[thruster_index].setData(*self.interpolated_curve(thruster_index))
 
     def setup_serial(self):
         """Initialize the serial connection."""
@@ -390,6 +657,9 @@ class ThrusterGUI(QMainWindow):
             if self.serial_conn.is_open :
                 print(f"Connected to {self.serial_port} at {self.baud_rate} baud")
                 self.serial_status = 1
+                self._tx_fd = serial_fileno(self.serial_conn)
+                if sys.platform == "win32":
+                    self.serial_conn.set_buffer_size(rx_size=4096, tx_size=8192)
         except serial.SerialException as e:
             print(f"Error opening serial port: {e}")
             self.serial_conn = None
@@ -398,24 +668,21 @@ class ThrusterGUI(QMainWindow):
     def change_frequency(self, freq):
         """Change the output frequency of serial messages."""
         self.output_frequency = int(freq)
-        if self.serial_timer.isActive():
-            self.serial_timer.start(1000 // self.output_frequency)
+        self.period_changed.emit(1000 // self.output_frequency)
             
-    def crc8(self, data: bytearray) -> int:
-        # Polinomio CRC-8: 0x07 (x^8 + x^7 + x^6 + x^5 + x^4 + x^3 + x^2 + 1)
-        polynomial = 0x07
-        crc = 0x00  # Inizializza il CRC a zero
-        
-        for byte in data:
-            crc ^= byte  # XOR del byte con il CRC
-            for _ in range(8):  # 8 bit per ogni byte
-                if crc & 0x80:  # Se il bit più significativo è 1
-                    crc = (crc << 1) ^ polynomial  # Shift a sinistra e XOR con il polinomio
-                else:
-                    crc <<= 1  # Solo shift a sinistra
-                crc &= 0xFF  # Mantieni solo gli 8 bit meno significativi (per evitare overflow)
-        
-        return crc
+    def crc8(self, data: bytearray, crc: int = 0x00) -> int:
+        # Polinomio CRC-8: 0x07 (x^8 + x^7 + x^6 + x^5 + x^4 + x^3 + x^2 + 1), tabellato in CRC8_TABLE
+        return crc8_update(crc, data)
+
+    def serial_send_raw(self, payload=None):
+        """
+        Send 16 already packed bytes (8 x uint16_t, little-endian) to the microcontroller via serial.
+        :param payload: PWM values packed and clamped by the caller, None if already packed into the TX buffer
+        """
+        if(self.serial_status == 1):
+            send_frame(self._tx_buf, self.serial_conn, self._tx_fd, payload, self._tx_log if self._debug else None)
+        else:
+            raise ConnectionError("Serial connection is not open. Check your port settings.")
 
     def serial_send(self, pwm_values):
         """
@@ -428,30 +695,19 @@ class ThrusterGUI(QMainWindow):
         # Ensure PWM values are clamped within [1100, 1900]
         pwm_values = [max(1100, min(1900, pwm)) for pwm in pwm_values]
 
-        # Pack the data into 16 bytes (8 x uint16_t) in little-endian format
-        print(pwm_values)
-        print(*pwm_values)
-        packet = struct.pack('<8H', *pwm_values)
-
-        # Open serial port and send data
-        if(self.serial_status == 1):
-            fullpacket = bytearray(bytes.fromhex('AA0000')) \
-                + bytearray(packet) \
-                + bytearray(struct.pack('<B', self.crc8(bytearray(bytes.fromhex('AA0000')) + bytearray(packet)))) \
-                + bytearray(bytes.fromhex('EE'))
-            self.serial_conn.write(fullpacket)
-            print(f"Sent: {pwm_values}")
-            print(f"The full bytes packet was: {fullpacket}")
-        else:
-            raise ConnectionError("Serial connection is not open. Check your port settings.")
+        # Pack the data into 16 bytes (8 x uint16_t) in little-endian format, straight into the TX buffer
+        struct.pack_into('<8H', self._tx_buf, 3, *pwm_values)
+        self.serial_send_raw()
 
     def serial_send_idle(self):
         """Send an idle command (1500 to all thrusters)."""
+        self.stop_output.emit()
         if(self.serial_status == 0) : self.setup_serial()
-        self.serial_timer.stop()
         self.serial_send([1500] * 8)
         self.serial_conn.close()
         self.serial_status = 0
+        self.status_label.setText("Status: STOPPED")
+        self.status_label.setStyleSheet("color: red; font-weight: bold;")
 
     def serial_start_stop(self):
         if self.serial_status == 1:
@@ -474,50 +730,27 @@ class ThrusterGUI(QMainWindow):
             self.serial_conn.write(bytes.fromhex('52'))
             self.serial_conn.write(bytes.fromhex('EE'))
         else : ConnectionError("Serial connection is not open. Check your port settings.")
-        self.com_step = 0 # at each step, we increment this, so I know what values I have to output
-        self.serial_timer.start(1000 // self.output_frequency)
+        self.start_output.emit(self.serial_conn, self.cached_pwms, 1000 // self.output_frequency)
+        self.status_label.setText("Status: RUNNING")
+        self.status_label.setStyleSheet("color: green; font-weight: bold;")
+
+    def update_status(self, step):
+        # steps queued before a stop can arrive after it, don't let them overwrite STOPPED
+        if self.serial_status == 1: self.status_label.setText(f"Status: RUNNING {step}/{self.cached_pwms.shape[1]}")
 
     def compute_max_time(self):
-        self.max_time = 0
-        for i in range(THRUSTER_COUNT):
-            if(self.points[i]):
-                times, _ = zip(*self.points[i])
-                a = max(times)
-                if a > self.max_time : self.max_time = a
+        if not self._max_time_dirty: return
+        # point lists are sorted by time, so the last point of each is its latest
+        self.max_time = max((points[-1][0] for points in self.points if points), default=0)
+        self._max_time_dirty = False
 
     def compute_pwms(self):
-        self.compute_max_time()
+        t_interp = self.time_axis()
+        pwms = np.empty((THRUSTER_COUNT, len(t_interp)), dtype='<u2') # same layout as the packet payload
         for i in range(THRUSTER_COUNT):
-            points = self.points[i]
-            times, pwm_values = zip(*points)
-            times = np.array(times)
-            pwm_values = np.array(pwm_values)
-            if self.selected_interpolation == "linear":
-                f = interp1d(times, pwm_values, kind="linear", fill_value="extrapolate")
-            elif self.selected_interpolation == "constant":
-                f = interp1d(times, pwm_values, kind="previous", fill_value="extrapolate")
-            elif self.selected_interpolation == "polynomial":
-                f = BarycentricInterpolator(times, pwm_values)
-            t_interp = np.linspace(0, round(self.max_time), int(self.max_time * self.output_frequency) + 1) # each step should be the same as the period
-            y_interp = f(t_interp)
-            y_interp = np.clip(y_interp, 1100, 1900)
-            self.cached_pwms[i] = (t_interp, y_interp)
-        # for i in range(THRUSTER_COUNT) : print(f"({time}, {pwm})" for time, pwm in self.cached_pwms[i])
-
-    def send_pwms(self):
-        if self.com_step <= int(self.max_time * self.output_frequency) + 1:
-            self.serial_send(self.get_pwms(self.com_step))
-            self.com_step += 1
-        else : self.serial_send_idle()
-
-    def get_pwms(self, step: int) -> list[int]:
-        """Lookup on cached pwm values"""
-        try :
-            result = []
-            for i in range(THRUSTER_COUNT):
-                result.append(int(self.cached_pwms[i][1][step]))
-        except : ...
-        return result
+            # same time axis as the plotted curves, so thrusters untouched since the last run are cache hits
+            _, pwms[i] = self.interpolated_curve(i)
+        self.cached_pwms = pwms # one row per thruster, one column per output step
 
     def json_save_sequence(self):
         """Save sequence to JSON file."""
@@ -556,9 +789,9 @@ class ThrusterGUI(QMainWindow):
                 self.output_frequency = data.get("frequency", 20)
 
                 for i in range(THRUSTER_COUNT):
-                    self.points[i] = data["thruster_data"].get(str(i), [])
+                    self.points[i] = sorted(data["thruster_data"].get(str(i), []))
+                    self.points_changed(i)
                     self.update_graph(i)
-                    self.interpolate_thruster_curve(i)
 
                 #self.compute_pwms()
                 print(f"Sequence loaded from {file_path}")
@@ -1,7 +1,7 @@
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QDialog, QCheckBox,
+    QPushButton, QLabel, QDialog, QCheckBox, QListWidget,
 )
 import copy
 
@@ -32,6 +32,37 @@ class CheckboxInputDialog(QDialog):
     def get_checked(self):
         return [i for i in range(8) if self.checkboxes[i].isChecked()]
 
+class PointSelectionDialog(QDialog):
+    def __init__(self, title="Select point", message="Select a point:", points=(), parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setGeometry(500, 300, 300, 300)
+
+        layout = QVBoxLayout()
+
+        self.label = QLabel(message)
+        layout.addWidget(self.label)
+
+        self.point_list = QListWidget()
+        self.point_list.addItems([f"t={t:.2f}s, PWM={p}" for t, p in points])
+        self.point_list.setCurrentRow(0)
+        self.point_list.itemDoubleClicked.connect(self.accept)
+        layout.addWidget(self.point_list)
+
+        self.ok_button = QPushButton("OK")
+        self.cancel_button = QPushButton("Cancel")
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button.clicked.connect(self.reject)
+
+        layout.addWidget(self.ok_button)
+        layout.addWidget(self.cancel_button)
+
+        self.setLayout(layout)
+
+    def get_selected(self):
+        # the row is the index in the point list, no need to match the text back
+        return self.point_list.currentRow()
+
 if __name__ == "__main__":
     import sys
     app = QApplication(sys.argv)